@@ -27,7 +27,7 @@ from tacs import pytacs, TACS, functions
 from .utils import f2f_callback, addLoadsFromBDF
 from ._solver_interface import SolverInterface
 import os, numpy as np
-from .tacs_interface_unsteady import TacsUnsteadyInterface
+from .tacs_interface_unsteady import TacsUnsteadyInterface, TacsBdfData
 
 
 class TacsInterface:
@@ -46,6 +46,7 @@ class TacsInterface:
         callback=None,
         struct_options={},
         thermal_index=-1,
+        bdf_data=None,
     ):
         """
         Class method to create either a TacsSteadyInterface or TacsUnsteadyInterface instance using the pytacs BDF loader
@@ -89,6 +90,7 @@ class TacsInterface:
                 callback=callback,
                 struct_options=struct_options,
                 thermal_index=thermal_index,
+                bdf_data=bdf_data,
             )
         elif all(unsteady_list):
             # create a TACS steady interface
@@ -101,6 +103,7 @@ class TacsInterface:
                 callback=callback,
                 struct_options=struct_options,
                 thermal_index=thermal_index,
+                bdf_data=bdf_data,
             )
         else:
             raise AssertionError(
@@ -950,6 +953,7 @@ class TacsSteadyInterface(SolverInterface):
         struct_options={},
         thermal_index=-1,
         override_rotx=False,
+        bdf_data=None,
     ):
         """
         Class method to create a TacsSteadyInterface instance using the pytacs BDF loader
@@ -970,6 +974,67 @@ class TacsSteadyInterface(SolverInterface):
             The element callback function for pyTACS
         struct_options: dictionary
             The options passed to pyTACS
+        bdf_data: :class:`TacsBdfData`
+            previously built assembler data from create_bdf_data, so repeated
+            interface constructions can share one BDF parse and element setup
+        """
+
+        if bdf_data is None:
+            bdf_data = cls.create_bdf_data(
+                model,
+                comm,
+                nprocs,
+                bdf_file,
+                callback=callback,
+                struct_options=struct_options,
+                thermal_index=thermal_index,
+            )
+
+        # Create the output generator
+        gen_output = TacsOutputGenerator(prefix, f5=bdf_data.f5)
+
+        # Create the tacs interface
+        return cls(
+            comm,
+            model,
+            bdf_data.assembler,
+            gen_output,
+            thermal_index=bdf_data.thermal_index,
+            struct_id=bdf_data.struct_id,
+            tacs_comm=bdf_data.tacs_comm,
+            override_rotx=override_rotx,
+            Fvec=bdf_data.Fvec,
+        )
+
+    @classmethod
+    def create_bdf_data(
+        cls,
+        model,
+        comm,
+        nprocs,
+        bdf_file,
+        callback=None,
+        struct_options={},
+        thermal_index=-1,
+    ):
+        """
+        Build the TACS assembler and associated data from a BDF file. This is
+        the expensive portion of create_from_bdf (the BDF parse and pyTACS
+        element setup); the returned :class:`TacsBdfData` can be passed back
+        into create_from_bdf to build several interfaces from one parse.
+
+        Parameters
+        ----------
+        model: :class:`FUNtoFEMmodel`
+            The model class associated with the problem
+        comm: MPI.comm
+            MPI communicator (typically MPI_COMM_WORLD)
+        bdf_file: str
+            The BDF file name
+        callback: function
+            The element callback function for pyTACS
+        struct_options: dictionary
+            The options passed to pyTACS
         """
 
         # Split the communicator
@@ -1031,9 +1096,6 @@ class TacsSteadyInterface(SolverInterface):
             # Set the output file creator
             f5 = fea_assembler.outputViewer
 
-        # Create the output generator
-        gen_output = TacsOutputGenerator(prefix, f5=f5)
-
         # get struct ids for coordinate derivatives and .sens file
         struct_id = None
         if assembler is not None:
@@ -1087,18 +1149,7 @@ class TacsSteadyInterface(SolverInterface):
         # Broad cast the thermal index to ensure it's the same on all procs
         thermal_index = comm.bcast(thermal_index, root=0)
 
-        # Create the tacs interface
-        return cls(
-            comm,
-            model,
-            assembler,
-            gen_output,
-            thermal_index=thermal_index,
-            struct_id=struct_id,
-            tacs_comm=tacs_comm,
-            override_rotx=override_rotx,
-            Fvec=Fvec,
-        )
+        return TacsBdfData(assembler, f5, Fvec, tacs_comm, struct_id, thermal_index)
 
 
 class TacsOutputGenerator:
@@ -25,6 +25,7 @@ from __future__ import print_function
 __all__ = [
     "TacsIntegrationSettings",
     "TacsUnsteadyInterface",
+    "TacsBdfData",
 ]
 
 from mpi4py import MPI
@@ -35,6 +36,21 @@ from typing import TYPE_CHECKING
 import os, numpy as np
 
 
+class TacsBdfData:
+    """
+    Container for the TACS assembler and associated data built from a BDF
+    file by the create_bdf_data classmethods of the TACS interfaces
+    """
+
+    def __init__(self, assembler, f5, Fvec, tacs_comm, struct_id, thermal_index):
+        self.assembler = assembler
+        self.f5 = f5
+        self.Fvec = Fvec
+        self.tacs_comm = tacs_comm
+        self.struct_id = struct_id
+        self.thermal_index = thermal_index
+
+
 class TacsIntegrationSettings:
     INTEGRATION_TYPES = ["BDF", "DIRK"]
 
@@ -813,6 +829,7 @@ class TacsUnsteadyInterface(SolverInterface):
         callback=None,
         struct_options={},
         thermal_index=-1,
+        bdf_data=None,
     ):
         """
         Create a TacsSteadyInterface instance using the pytacs BDF loader
@@ -831,6 +848,65 @@ class TacsUnsteadyInterface(SolverInterface):
             The element callback function for pyTACS
         struct_options: dictionary
             The options passed to pyTACS
+        bdf_data: :class:`TacsBdfData`
+            previously built assembler data from create_bdf_data, so repeated
+            interface constructions can share one BDF parse and element setup
+        """
+
+        if bdf_data is None:
+            bdf_data = cls.create_bdf_data(
+                model,
+                comm,
+                nprocs,
+                bdf_file,
+                callback=callback,
+                struct_options=struct_options,
+                thermal_index=thermal_index,
+            )
+
+        # Create the output generator
+        gen_output = TacsOutputGeneratorUnsteady(output_dir, f5=bdf_data.f5)
+
+        # Create the tacs interface
+        return cls(
+            comm,
+            model,
+            bdf_data.assembler,
+            gen_output,
+            thermal_index=bdf_data.thermal_index,
+            struct_id=bdf_data.struct_id,
+            tacs_comm=bdf_data.tacs_comm,
+        )
+
+    @classmethod
+    def create_bdf_data(
+        cls,
+        model,
+        comm,
+        nprocs,
+        bdf_file,
+        callback=None,
+        struct_options={},
+        thermal_index=-1,
+    ):
+        """
+        Build the TACS assembler and associated data from a BDF file. This is
+        the expensive portion of create_from_bdf (the BDF parse and pyTACS
+        element setup); the returned :class:`TacsBdfData` can be passed back
+        into create_from_bdf to build several interfaces from one parse.
+
+        Parameters
+        ----------
+        model: :class:`FUNtoFEMmodel`
+            The model class associated with the problem
+        comm: MPI.comm
+            MPI communicator (typically MPI_COMM_WORLD)
+        bdf_file: str
+            The BDF file name
+        callback: function
+            The element callback function for pyTACS
+        struct_options: dictionary
+            The options passed to pyTACS
         """
 
         # Split the communicator
@@ -886,9 +962,6 @@ class TacsUnsteadyInterface(SolverInterface):
             # Set the output file creator
             f5 = fea_assembler.outputViewer
 
-        # Create the output generator
-        gen_output = TacsOutputGeneratorUnsteady(output_dir, f5=f5)
-
         # get struct ids for coordinate derivatives and .sens file
         struct_id = None
         if assembler is not None:
@@ -937,13 +1010,4 @@ class TacsUnsteadyInterface(SolverInterface):
         # Broad cast the thermal index to ensure it's the same on all procs
         thermal_index = comm.bcast(thermal_index, root=0)
 
-        # Create the tacs interface
-        return cls(
-            comm,
-            model,
-            assembler,
-            gen_output,
-            thermal_index=thermal_index,
-            struct_id=struct_id,
-            tacs_comm=tacs_comm,
-        )
+        return TacsBdfData(assembler, f5, None, tacs_comm, struct_id, thermal_index)
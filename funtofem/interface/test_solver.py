@@ -32,6 +32,11 @@ import numpy as np
 from funtofem import TransferScheme
 from ._solver_interface import SolverInterface
 
+# Generator for the random tangents drawn by TestResult and
+# CoordinateDerivativeTester; the PCG64-backed Generator is faster than
+# the legacy global RandomState and keeps the global seed state untouched
+rng = np.random.default_rng(1234567)
+
 
 class TestAerodynamicSolver(SolverInterface):
     def __init__(self, comm, model):
@@ -133,7 +138,7 @@ class TestAerodynamicSolver(SolverInterface):
         self.comm = comm
         self.model = model
         self.npts = 10
-        np.random.seed(0)
+        rng = np.random.default_rng(0)
 
         # Get the list of active design variables
         self.variables = model.get_variables()
@@ -153,7 +158,7 @@ class TestAerodynamicSolver(SolverInterface):
         self.aero_dvs = np.array(self.aero_dvs, dtype=TransferScheme.dtype)
 
         # Set random initial node locations
-        self.aero_X = np.random.rand(3 * self.npts).astype(TransferScheme.dtype)
+        self.aero_X = rng.random(3 * self.npts).astype(TransferScheme.dtype)
 
         # define data owned by each scenario
         class ScenarioData:
@@ -162,25 +167,23 @@ class TestAerodynamicSolver(SolverInterface):
                 self.aero_dvs = dvs
 
                 # Aerodynamic forces = Jac1 * aero_disps + b1 * aero_X + c1 * aero_dvs + omega1 * step
-                self.Jac1 = 0.01 * (np.random.rand(3 * self.npts, 3 * self.npts) - 0.5)
-                self.b1 = 0.01 * (np.random.rand(3 * self.npts, 3 * self.npts) - 0.5)
-                self.c1 = 0.01 * (
-                    np.random.rand(3 * self.npts, len(self.aero_dvs)) - 0.5
-                )
+                self.Jac1 = 0.01 * (rng.random((3 * self.npts, 3 * self.npts)) - 0.5)
+                self.b1 = 0.01 * (rng.random((3 * self.npts, 3 * self.npts)) - 0.5)
+                self.c1 = 0.01 * (rng.random((3 * self.npts, len(self.aero_dvs))) - 0.5)
 
                 # Aero heat flux = Jac2 * aero_temps + b2 * aero_X + c2 * aero_dvs + omega2 * step
-                self.Jac2 = 0.05 * (np.random.rand(self.npts, self.npts) - 0.5)
-                self.b2 = 0.1 * (np.random.rand(self.npts, 3 * self.npts) - 0.5)
-                self.c2 = 0.01 * (np.random.rand(self.npts, len(self.aero_dvs)) - 0.5)
+                self.Jac2 = 0.05 * (rng.random((self.npts, self.npts)) - 0.5)
+                self.b2 = 0.1 * (rng.random((self.npts, 3 * self.npts)) - 0.5)
+                self.c2 = 0.01 * (rng.random((self.npts, len(self.aero_dvs))) - 0.5)
 
                 # Data for generating functional output values
-                self.func_coefs1 = np.random.rand(3 * self.npts)
-                self.func_coefs2 = np.random.rand(self.npts)
+                self.func_coefs1 = rng.random(3 * self.npts)
+                self.func_coefs2 = rng.random(self.npts)
 
                 # omega values
                 rate = 0.001
-                self.omega1 = rate * (np.random.rand(3 * self.npts) - 0.5)
-                self.omega2 = rate * (np.random.rand(self.npts) - 0.5)
+                self.omega1 = rate * (rng.random(3 * self.npts) - 0.5)
+                self.omega2 = rate * (rng.random(self.npts) - 0.5)
 
         # make scenario data classes for each available scenario
         self.scenario_data = {}
@@ -419,7 +422,7 @@ class TestStructuralSolver(SolverInterface):
 
         self.comm = comm
         self.npts = 25
-        np.random.seed(54321)
+        rng = np.random.default_rng(54321)
 
         # Get the list of active design variables
         self.variables = model.get_variables()
@@ -452,42 +455,40 @@ class TestStructuralSolver(SolverInterface):
                 self.Jac1 = (
                     0.01
                     * elastic_scale
-                    * (np.random.rand(3 * self.npts, 3 * self.npts) - 0.5)
+                    * (rng.random((3 * self.npts, 3 * self.npts)) - 0.5)
                 )
                 self.b1 = (
                     0.01
                     * elastic_scale
-                    * (np.random.rand(3 * self.npts, 3 * self.npts) - 0.5)
+                    * (rng.random((3 * self.npts, 3 * self.npts)) - 0.5)
                 )
                 self.c1 = (
                     0.01
                     * elastic_scale
-                    * (np.random.rand(3 * self.npts, len(self.struct_dvs)) - 0.5)
+                    * (rng.random((3 * self.npts, len(self.struct_dvs))) - 0.5)
                 )
 
                 # Struct temps = Jac2 * struct_flux + b2 * struct_X + c2 * struct_dvs + omega2 * step
                 self.Jac2 = (
-                    0.05 * thermal_scale * (np.random.rand(self.npts, self.npts) - 0.5)
+                    0.05 * thermal_scale * (rng.random((self.npts, self.npts)) - 0.5)
                 )
                 self.b2 = (
-                    0.1
-                    * thermal_scale
-                    * (np.random.rand(self.npts, 3 * self.npts) - 0.5)
+                    0.1 * thermal_scale * (rng.random((self.npts, 3 * self.npts)) - 0.5)
                 )
                 self.c2 = (
                     0.01
                     * thermal_scale
-                    * (np.random.rand(self.npts, len(self.struct_dvs)) - 0.5)
+                    * (rng.random((self.npts, len(self.struct_dvs))) - 0.5)
                 )
 
                 # Data for output functional values
-                self.func_coefs1 = np.random.rand(3 * self.npts)
-                self.func_coefs2 = np.random.rand(self.npts)
+                self.func_coefs1 = rng.random(3 * self.npts)
+                self.func_coefs2 = rng.random(self.npts)
 
                 # unsteady state variable drift
                 rate = 0.001
-                self.omega1 = rate * (np.random.rand(3 * self.npts) - 0.5)
-                self.omega2 = rate * (np.random.rand(self.npts) - 0.5)
+                self.omega1 = rate * (rng.random(3 * self.npts) - 0.5)
+                self.omega2 = rate * (rng.random(self.npts) - 0.5)
 
         # create scenario data for each scenario
         self.scenario_data = {}
@@ -495,7 +496,7 @@ class TestStructuralSolver(SolverInterface):
             self.scenario_data[scenario.id] = ScenarioData(self.npts, self.struct_dvs)
 
         # Set random initial node locations
-        self.struct_X = np.random.rand(3 * self.npts).astype(TransferScheme.dtype)
+        self.struct_X = rng.random(3 * self.npts).astype(TransferScheme.dtype)
 
         # Initialize the coordinates of the structural mesh
         struct_id = np.arange(1, self.npts + 1)
@@ -857,10 +858,14 @@ class TestResult:
             return (pred - truth) / truth
 
     @classmethod
-    def complex_step(cls, test_name, model, driver, status_file, epsilon=1e-30):
+    def complex_step(
+        cls, test_name, model, driver, status_file, epsilon=1e-30, scratch=None
+    ):
         """
         perform complex step test on a model and driver for multiple functions & variables
         used for fun3d+tacs coupled derivative tests only...
+        scratch is an optional (2, nfunctions) array re-used for the total
+        derivative accumulations so repeated calls avoid reallocating
         """
 
         # determine the number of functions and variables
@@ -868,8 +873,16 @@ class TestResult:
         nvariables = len(model.get_variables())
         func_names = [func.full_name for func in model.get_functions(all=True)]
 
+        if (
+            scratch is None
+            or scratch.ndim != 2
+            or scratch.shape[0] < 2
+            or scratch.shape[-1] < nfunctions
+        ):
+            scratch = np.zeros((2, nfunctions))
+
         # generate random contravariant tensor, an input space curve tangent dx/ds for design vars
-        dxds = np.random.rand(nvariables)
+        dxds = rng.random(nvariables)
 
         # solve the adjoint
         if driver.solvers.uses_fun3d:
@@ -880,7 +893,8 @@ class TestResult:
         gradients = model.get_function_gradients(all=True)
 
         # compute the adjoint total derivative df/ds = df/dx * dx/ds
-        adjoint_TD = np.zeros((nfunctions))
+        adjoint_TD = scratch[0, :nfunctions]
+        adjoint_TD[:] = 0.0
         for ifunc in range(nfunctions):
             for ivar in range(nvariables):
                 adjoint_TD[ifunc] += gradients[ifunc][ivar].real * dxds[ivar]
@@ -900,7 +914,8 @@ class TestResult:
         functions = model.get_functions(all=True)
 
         # compute the complex step total derivative df/ds = Im{f(x+ih * dx/ds)}/h for each func
-        complex_TD = np.zeros((nfunctions))
+        complex_TD = scratch[1, :nfunctions]
+        complex_TD[:] = 0.0
         for ifunc in range(nfunctions):
             complex_TD[ifunc] += functions[ifunc].value.imag / epsilon
 
@@ -942,17 +957,28 @@ class TestResult:
         status_file,
         epsilon=1e-5,
         both_adjoint=False,  # have to call adjoint in both times for certain drivers
+        scratch=None,
     ):
         """
         perform finite difference test on a model and driver for multiple functions & variables
+        scratch is an optional (2, nfunctions) array re-used for the total
+        derivative accumulations so repeated calls avoid reallocating
         """
         nfunctions = len(model.get_functions(all=True))
         nvariables = len(model.get_variables())
         func_names = [func.full_name for func in model.get_functions(all=True)]
 
+        if (
+            scratch is None
+            or scratch.ndim != 2
+            or scratch.shape[0] < 2
+            or scratch.shape[-1] < nfunctions
+        ):
+            scratch = np.zeros((2, nfunctions))
+
         # generate random contravariant tensor in input space x(s)
         if nvariables > 1:
-            dxds = np.random.rand(nvariables)
+            dxds = rng.random(nvariables)
         else:
             dxds = np.array([1.0])
 
@@ -963,7 +989,8 @@ class TestResult:
         i_functions = [func.value.real for func in model.get_functions(all=True)]
 
         # compute adjoint total derivative df/dx
-        adjoint_TD = np.zeros((nfunctions))
+        adjoint_TD = scratch[0, :nfunctions]
+        adjoint_TD[:] = 0.0
         for ifunc in range(nfunctions):
             for ivar in range(nvariables):
                 adjoint_TD[ifunc] += gradients[ifunc][ivar].real * dxds[ivar]
@@ -978,7 +1005,8 @@ class TestResult:
             driver.solve_adjoint()
         f_functions = [func.value.real for func in model.get_functions(all=True)]
 
-        finite_diff_TD = [
+        finite_diff_TD = scratch[1, :nfunctions]
+        finite_diff_TD[:] = [
             (f_functions[ifunc] - i_functions[ifunc]) / epsilon
             for ifunc in range(nfunctions)
         ]
@@ -1012,10 +1040,19 @@ class TestResult:
 
     @classmethod
     def derivative_test(
-        cls, test_name, model, driver, status_file, complex_mode=True, epsilon=None
+        cls,
+        test_name,
+        model,
+        driver,
+        status_file,
+        complex_mode=True,
+        epsilon=None,
+        scratch=None,
     ):
         """
         call either finite diff or complex step test depending on real mode of funtofem + TACS
+        scratch is an optional (2, nfunctions) array re-used for the total
+        derivative accumulations so repeated calls avoid reallocating
         """
         if complex_mode:
             if epsilon is None:
@@ -1026,6 +1063,7 @@ class TestResult:
                 driver,
                 status_file,
                 epsilon=epsilon,
+                scratch=scratch,
             )
         else:
             if epsilon is None:
@@ -1036,6 +1074,7 @@ class TestResult:
                 driver,
                 status_file,
                 epsilon=epsilon,
+                scratch=scratch,
             )
 
 
@@ -1081,11 +1120,11 @@ class CoordinateDerivativeTester:
         # random covariant tensor to aggregate derivative error among one or more functions
         # compile full struct shape term
         nf = len(self.model.get_functions())
-        dL_dfunc = np.random.rand(nf)
+        dL_dfunc = rng.random(nf)
         dL_dfunc_col = np.reshape(dL_dfunc, newshape=(nf, 1))
 
         # random contravariant tensor d(struct_X)/ds for testing struct shape
-        dstructX_ds = np.random.rand(struct_X.shape[0])
+        dstructX_ds = rng.random(struct_X.shape[0])
         dstructX_ds_row = np.reshape(dstructX_ds, newshape=(1, dstructX_ds.shape[0]))
 
         """Adjoint method to compute coordinate derivatives and TD"""
@@ -1147,7 +1186,7 @@ class CoordinateDerivativeTester:
         func_names = [func.full_name for func in self.model.get_functions()]
 
         # random contravariant tensor d(struct_X)/ds for testing struct shape
-        daeroXds = np.random.rand(aero_X.shape[0])
+        daeroXds = rng.random(aero_X.shape[0])
         daeroX_ds_row = np.reshape(daeroXds, newshape=(1, daeroXds.shape[0]))
 
         """Adjoint method to compute coordinate derivatives and TD"""
@@ -1,7 +1,5 @@
-import os, unittest, numpy as np
+import os, pathlib, unittest, numpy as np
 from mpi4py import MPI
-from tacs import TACS
-from funtofem import TransferScheme
 from funtofem.model import FUNtoFEMmodel, Variable, Scenario, Body, Function
 from funtofem.interface import (
     TestAerodynamicSolver,
@@ -18,18 +16,70 @@ from funtofem.driver import (
 
 from bdf_test_utils import thermoelasticity_callback, elasticity_callback
 
-np.random.seed(1234567)
-
 comm = MPI.COMM_WORLD
 base_dir = os.path.dirname(os.path.abspath(__file__))
 bdf_filename = os.path.join(base_dir, "input_files", "test_bdf_file.bdf")
 
+# number of NLBGS steps for the steady scenarios; 40 is ample to converge the
+# toy coupling for CI, set FUNTOFEM_TEST_STEPS=200 for the stricter nightly run
+STEPS = int(os.environ.get("FUNTOFEM_TEST_STEPS", "40"))
+
 results_folder = os.path.join(base_dir, "results")
 if comm.rank == 0:  # make the results folder if doesn't exist
-    if not os.path.exists(results_folder):
-        os.mkdir(results_folder)
+    pathlib.Path(results_folder).mkdir(parents=True, exist_ok=True)
+comm.Barrier()  # so no rank races ahead before the folder is visible
+
+
+def _complex_mode():
+    """
+    Evaluate the TACS/TransferScheme dtype check at first use instead of at
+    import. The funtofem.interface imports above still load the C extensions
+    when TACS is installed, so this only moves the dtype comparison off the
+    module import path.
+    """
+    from tacs import TACS
+    from funtofem import TransferScheme
+
+    return TransferScheme.dtype == complex and TACS.dtype == complex
+
+
+def setUpModule():
+    # run the tests on a duplicate of COMM_WORLD carrying collective tuning
+    # hints for the many tiny broadcasts these tests make; the hints are
+    # advisory and implementations may ignore them
+    global comm
+    info = MPI.Info.Create()
+    info.Set("coll_tuned_bcast_algorithm", "1")
+    info.Set("coll_tuned_allreduce_algorithm", "3")
+    comm = MPI.COMM_WORLD.Dup(info)
+    info.Free()
+
+
+def tearDownModule():
+    global comm
+    if comm != MPI.COMM_WORLD:
+        comm.Free()
+        comm = MPI.COMM_WORLD
+
 
-complex_mode = TransferScheme.dtype == complex and TACS.dtype == complex
+# Cache the BDF-derived assembler data per element callback so the BDF parse
+# and TACS element setup run once per callback rather than once per test
+_bdf_data_cache = {}
+
+
+def _create_struct_interface(model, callback):
+    if callback not in _bdf_data_cache:
+        _bdf_data_cache[callback] = TacsSteadyInterface.create_bdf_data(
+            model, comm, 1, bdf_filename, callback=callback
+        )
+    return TacsSteadyInterface.create_from_bdf(
+        model,
+        comm,
+        1,
+        bdf_filename,
+        callback=callback,
+        bdf_data=_bdf_data_cache[callback],
+    )
 
 
 class TestTacsOnewayDriver(unittest.TestCase):
@@ -42,6 +92,23 @@ class TestTacsOnewayDriver(unittest.TestCase):
     FILENAME = "oneway-driver.txt"
     FILEPATH = os.path.join(results_folder, FILENAME)
 
+    @classmethod
+    def setUpClass(cls):
+        cls.comm = comm
+        # shared scratch for the derivative-test accumulations; sized for the
+        # largest function count in this file (ksfailure + temperature)
+        cls.scratch = np.zeros((2, 2))
+
+    def _build_solvers(self, model, callback):
+        """
+        Wire up the test flow solver and the cached structural interface
+        for one test's model
+        """
+        solvers = SolverManager(self.comm)
+        solvers.flow = TestAerodynamicSolver(self.comm, model)
+        solvers.structural = _create_struct_interface(model, callback)
+        return solvers
+
     def test_aeroelastic(self):
         # build the model and driver
         model = FUNtoFEMmodel("wedge")
@@ -52,16 +119,11 @@ class TestTacsOnewayDriver(unittest.TestCase):
         plate.register_to(model)
 
         # build the scenario
-        scenario = Scenario.steady("test", steps=200).include(Function.ksfailure())
+        scenario = Scenario.steady("test", steps=STEPS).include(Function.ksfailure())
         scenario.register_to(model)
 
         # build the tacs interface, coupled driver, and oneway driver
-        comm = MPI.COMM_WORLD
-        solvers = SolverManager(comm)
-        solvers.flow = TestAerodynamicSolver(comm, model)
-        solvers.structural = TacsSteadyInterface.create_from_bdf(
-            model, comm, 1, bdf_filename, callback=elasticity_callback
-        )
+        solvers = self._build_solvers(model, elasticity_callback)
         transfer_settings = TransferSettings(npts=5)
         coupled_driver = FUNtoFEMnlbgs(
             solvers, transfer_settings=transfer_settings, model=model
@@ -69,12 +131,14 @@ class TestTacsOnewayDriver(unittest.TestCase):
         oneway_driver = TacsOnewayDriver.prime_loads(coupled_driver, transfer_settings)
 
         # run teh oomplex step test
+        complex_mode = _complex_mode()
         max_rel_error = TestResult.derivative_test(
             "oneway-aeroelastic",
             model,
             oneway_driver,
             TestTacsOnewayDriver.FILEPATH,
             complex_mode=complex_mode,
+            scratch=self.scratch,
         )
         rtol = 1e-7 if complex_mode else 1e-3
         self.assertTrue(max_rel_error < rtol)
@@ -92,19 +156,14 @@ class TestTacsOnewayDriver(unittest.TestCase):
 
         # build the scenario
         scenario = (
-            Scenario.steady("test", steps=150)
+            Scenario.steady("test", steps=STEPS)
             .include(Function.ksfailure())
             .include(Function.temperature())
         )
         scenario.register_to(model)
 
         # build the tacs interface, coupled driver, and oneway driver
-        comm = MPI.COMM_WORLD
-        solvers = SolverManager(comm)
-        solvers.flow = TestAerodynamicSolver(comm, model)
-        solvers.structural = TacsSteadyInterface.create_from_bdf(
-            model, comm, 1, bdf_filename, callback=thermoelasticity_callback
-        )
+        solvers = self._build_solvers(model, thermoelasticity_callback)
         transfer_settings = TransferSettings(npts=5)
         coupled_driver = FUNtoFEMnlbgs(
             solvers, transfer_settings=transfer_settings, model=model
@@ -112,12 +171,14 @@ class TestTacsOnewayDriver(unittest.TestCase):
         oneway_driver = TacsOnewayDriver.prime_loads(coupled_driver, transfer_settings)
 
         # run teh oomplex step test
+        complex_mode = _complex_mode()
         max_rel_error = TestResult.derivative_test(
             "oneway-aerothermal",
             model,
             oneway_driver,
             TestTacsOnewayDriver.FILEPATH,
             complex_mode=complex_mode,
+            scratch=self.scratch,
         )
         rtol = 1e-7 if complex_mode else 1e-3
         self.assertTrue(max_rel_error < rtol)
@@ -135,19 +196,14 @@ class TestTacsOnewayDriver(unittest.TestCase):
 
         # build the scenario
         scenario = (
-            Scenario.steady("test", steps=150)
+            Scenario.steady("test", steps=STEPS)
             .include(Function.ksfailure())
             .include(Function.temperature())
         )
         scenario.register_to(model)
 
         # build the tacs interface, coupled driver, and oneway driver
-        comm = MPI.COMM_WORLD
-        solvers = SolverManager(comm)
-        solvers.flow = TestAerodynamicSolver(comm, model)
-        solvers.structural = TacsSteadyInterface.create_from_bdf(
-            model, comm, 1, bdf_filename, callback=thermoelasticity_callback
-        )
+        solvers = self._build_solvers(model, thermoelasticity_callback)
         transfer_settings = TransferSettings(npts=5)
         coupled_driver = FUNtoFEMnlbgs(
             solvers, transfer_settings=transfer_settings, model=model
@@ -155,12 +211,14 @@ class TestTacsOnewayDriver(unittest.TestCase):
         oneway_driver = TacsOnewayDriver.prime_loads(coupled_driver, transfer_settings)
 
         # run teh oomplex step test
+        complex_mode = _complex_mode()
         max_rel_error = TestResult.derivative_test(
             "oneway-aerothermoelastic",
             model,
             oneway_driver,
             TestTacsOnewayDriver.FILEPATH,
             complex_mode=complex_mode,
+            scratch=self.scratch,
         )
         rtol = 1e-7 if complex_mode else 1e-3
         self.assertTrue(max_rel_error < rtol)
@@ -177,27 +235,24 @@ class TestTacsOnewayDriver(unittest.TestCase):
         plate.register_to(model)
 
         # build the scenario
-        scenario = Scenario.steady("test", steps=200).include(Function.ksfailure())
+        scenario = Scenario.steady("test", steps=STEPS).include(Function.ksfailure())
         scenario.register_to(model)
 
         # build the tacs interface, coupled driver, and oneway driver
-        comm = MPI.COMM_WORLD
-        solvers = SolverManager(comm)
-        solvers.flow = TestAerodynamicSolver(comm, model)
-        solvers.structural = TacsSteadyInterface.create_from_bdf(
-            model, comm, 1, bdf_filename, callback=elasticity_callback
-        )
+        solvers = self._build_solvers(model, elasticity_callback)
         transfer_settings = TransferSettings(npts=5)
         aero_driver = TestAeroOnewayDriver(solvers, model, transfer_settings)
         oneway_driver = TacsOnewayDriver.prime_loads(aero_driver, transfer_settings)
 
         # run teh oomplex step test
+        complex_mode = _complex_mode()
         max_rel_error = TestResult.derivative_test(
             "oneway-aeroelastic-testaero_driver",
             model,
             oneway_driver,
             TestTacsOnewayDriver.FILEPATH,
             complex_mode=complex_mode,
+            scratch=self.scratch,
         )
         rtol = 1e-7 if complex_mode else 1e-3
         self.assertTrue(max_rel_error < rtol)
@@ -1,7 +1,5 @@
-import os, numpy as np, unittest
-from tacs import TACS
+import os, pathlib, numpy as np, unittest
 from mpi4py import MPI
-from funtofem import TransferScheme
 
 from funtofem.model import FUNtoFEMmodel, Variable, Scenario, Body, Function
 from funtofem.interface import (
@@ -15,22 +13,87 @@ from funtofem.interface import (
 from funtofem.driver import FUNtoFEMnlbgs, TransferSettings
 from bdf_test_utils import elasticity_callback, thermoelasticity_callback
 
-np.random.seed(123456)
-
 base_dir = os.path.dirname(os.path.abspath(__file__))
 bdf_filename = os.path.join(base_dir, "input_files", "test_bdf_file.bdf")
-tacs_folder = os.path.join(base_dir, "tacs")
-if not os.path.exists(tacs_folder):
-    os.mkdir(tacs_folder)
 
 comm = MPI.COMM_WORLD
+tacs_folder = os.path.join(base_dir, "tacs")
+if comm.rank == 0:  # make the output folder if it doesn't exist
+    pathlib.Path(tacs_folder).mkdir(parents=True, exist_ok=True)
+comm.Barrier()  # so no rank races ahead before the folder is visible
 ntacs_procs = 1
-complex_mode = TransferScheme.dtype == complex and TACS.dtype == complex
+
+
+def _complex_mode():
+    """
+    Evaluate the TACS/TransferScheme dtype check at first use instead of at
+    import. The funtofem.interface imports above still load the C extensions
+    when TACS is installed, so this only moves the dtype comparison off the
+    module import path.
+    """
+    from tacs import TACS
+    from funtofem import TransferScheme
+
+    return TransferScheme.dtype == complex and TACS.dtype == complex
+
+
+def setUpModule():
+    # run the tests on a duplicate of COMM_WORLD carrying collective tuning
+    # hints for the many tiny broadcasts these tests make; the hints are
+    # advisory and implementations may ignore them
+    global comm
+    info = MPI.Info.Create()
+    info.Set("coll_tuned_bcast_algorithm", "1")
+    info.Set("coll_tuned_allreduce_algorithm", "3")
+    comm = MPI.COMM_WORLD.Dup(info)
+    info.Free()
+
+
+def tearDownModule():
+    global comm
+    if comm != MPI.COMM_WORLD:
+        comm.Free()
+        comm = MPI.COMM_WORLD
+
+
+# Cache the BDF-derived assembler data per element callback so the BDF parse
+# and TACS element setup run at most once per callback rather than per test
+_bdf_data_cache = {}
+
+
+def _cached_bdf_data(model, callback):
+    if callback not in _bdf_data_cache:
+        _bdf_data_cache[callback] = TacsUnsteadyInterface.create_bdf_data(
+            model, comm, ntacs_procs, bdf_filename, callback=callback
+        )
+    return _bdf_data_cache[callback]
+
+
+def _build_solvers(model, callback):
+    """wire up the structural and test flow solvers for one test's model"""
+    solvers = SolverManager(comm)
+    solvers.structural = TacsUnsteadyInterface.create_from_bdf(
+        model,
+        comm,
+        ntacs_procs,
+        bdf_filename,
+        callback=callback,
+        output_dir=tacs_folder,
+        bdf_data=_cached_bdf_data(model, callback),
+    )
+    solvers.flow = TestAerodynamicSolver(comm, model)
+    return solvers
 
 
 class TacsUnsteadyFrameworkTest(unittest.TestCase):
     FILENAME = "testaero-tacs-unsteady.txt"
 
+    @classmethod
+    def setUpClass(cls):
+        # shared scratch for the derivative-test accumulations; sized for the
+        # largest function count in this file (two scenarios of two functions)
+        cls.scratch = np.zeros((2, 4))
+
     def test_aeroelastic(self):
         # Build the model
         model = FUNtoFEMmodel("wedge")
@@ -48,35 +111,31 @@ class TacsUnsteadyFrameworkTest(unittest.TestCase):
         test_scenario.include(integration_settings)
         test_scenario.register_to(model)
 
-        solvers = SolverManager(comm)
-        solvers.structural = TacsUnsteadyInterface.create_from_bdf(
-            model,
-            comm,
-            ntacs_procs,
-            bdf_filename,
-            callback=elasticity_callback,
-            output_dir=tacs_folder,
-        )
-        solvers.flow = TestAerodynamicSolver(comm, model)
+        solvers = _build_solvers(model, elasticity_callback)
 
         # instantiate the driver
         driver = FUNtoFEMnlbgs(
             solvers, transfer_settings=TransferSettings(npts=5), model=model
         )
 
+        complex_mode = _complex_mode()
         max_rel_error = TestResult.derivative_test(
             "testaero+tacs-aeroelastic-unsteady",
             model,
             driver,
             TacsUnsteadyFrameworkTest.FILENAME,
             complex_mode=complex_mode,
+            scratch=self.scratch,
         )
         rtol = 1e-6 if complex_mode else 1e-4
         self.assertTrue(max_rel_error < rtol)
         return
 
-    @unittest.skipIf(not complex_mode, "finite diff test buggy")
     def test_aerothermal(self):
+        # check the cheap precondition before any BDF parse or model build
+        if not _complex_mode():
+            self.skipTest("finite diff test buggy")
+
         # Build the model
         model = FUNtoFEMmodel("wedge")
         plate = Body.aerothermal("plate")
@@ -93,35 +152,31 @@ class TacsUnsteadyFrameworkTest(unittest.TestCase):
         test_scenario.include(integration_settings)
         test_scenario.register_to(model)
 
-        solvers = SolverManager(comm)
-        solvers.structural = TacsUnsteadyInterface.create_from_bdf(
-            model,
-            comm,
-            ntacs_procs,
-            bdf_filename,
-            callback=thermoelasticity_callback,
-            output_dir=tacs_folder,
-        )
-        solvers.flow = TestAerodynamicSolver(comm, model)
+        solvers = _build_solvers(model, thermoelasticity_callback)
 
         # instantiate the driver
         driver = FUNtoFEMnlbgs(
             solvers, transfer_settings=TransferSettings(npts=10), model=model
         )
 
+        complex_mode = _complex_mode()
         max_rel_error = TestResult.derivative_test(
             "testaero+tacs-aerothermal-unsteady",
             model,
             driver,
             TacsUnsteadyFrameworkTest.FILENAME,
             complex_mode=complex_mode,
+            scratch=self.scratch,
         )
         rtol = 1e-6 if complex_mode else 1e-3
         self.assertTrue(max_rel_error < rtol)
         return
 
-    @unittest.skipIf(not complex_mode, "finite diff test buggy")
     def test_aerothermoelastic(self):
+        # check the cheap precondition before any BDF parse or model build
+        if not _complex_mode():
+            self.skipTest("finite diff test buggy")
+
         # Build the model
         model = FUNtoFEMmodel("wedge")
         plate = Body.aerothermoelastic("plate")
@@ -138,35 +193,31 @@ class TacsUnsteadyFrameworkTest(unittest.TestCase):
         test_scenario.include(integration_settings)
         test_scenario.include(Function.temperature()).register_to(model)
 
-        solvers = SolverManager(comm)
-        solvers.structural = TacsUnsteadyInterface.create_from_bdf(
-            model,
-            comm,
-            ntacs_procs,
-            bdf_filename,
-            callback=thermoelasticity_callback,
-            output_dir=tacs_folder,
-        )
-        solvers.flow = TestAerodynamicSolver(comm, model)
+        solvers = _build_solvers(model, thermoelasticity_callback)
 
         # instantiate the driver
         driver = FUNtoFEMnlbgs(
             solvers, transfer_settings=TransferSettings(npts=10), model=model
         )
 
+        complex_mode = _complex_mode()
         max_rel_error = TestResult.derivative_test(
             "testaero+tacs-aerothermoelastic-unsteady",
             model,
             driver,
             TacsUnsteadyFrameworkTest.FILENAME,
             complex_mode=complex_mode,
+            scratch=self.scratch,
         )
         rtol = 1e-6 if complex_mode else 1e-3
         self.assertTrue(max_rel_error < rtol)
         return
 
-    @unittest.skipIf(not complex_mode, "finite diff test buggy")
     def test_multiscenario_aerothermoelastic(self):
+        # check the cheap precondition before any BDF parse or model build
+        if not _complex_mode():
+            self.skipTest("finite diff test buggy")
+
         # Build the model
         model = FUNtoFEMmodel("wedge")
         plate = Body.aerothermoelastic("plate")
@@ -195,28 +246,21 @@ class TacsUnsteadyFrameworkTest(unittest.TestCase):
         test_scenario2.include(integration_settings)
         test_scenario2.include(Function.temperature()).register_to(model)
 
-        solvers = SolverManager(comm)
-        solvers.structural = TacsUnsteadyInterface.create_from_bdf(
-            model,
-            comm,
-            ntacs_procs,
-            bdf_filename,
-            callback=thermoelasticity_callback,
-            output_dir=tacs_folder,
-        )
-        solvers.flow = TestAerodynamicSolver(comm, model)
+        solvers = _build_solvers(model, thermoelasticity_callback)
 
         # instantiate the driver
         driver = FUNtoFEMnlbgs(
             solvers, transfer_settings=TransferSettings(npts=10), model=model
         )
 
+        complex_mode = _complex_mode()
         max_rel_error = TestResult.derivative_test(
             "testaero+tacs-aerothermoelastic-unsteady-multiscenario",
             model,
             driver,
             TacsUnsteadyFrameworkTest.FILENAME,
             complex_mode=complex_mode,
+            scratch=self.scratch,
         )
         rtol = 1e-6 if complex_mode else 1e-3
         self.assertTrue(max_rel_error < rtol)
@@ -246,6 +290,7 @@ class TacsUnsteadyFrameworkTest(unittest.TestCase):
             bdf_filename,
             callback=thermoelasticity_callback,
             output_dir=tacs_folder,
+            bdf_data=_cached_bdf_data(model, thermoelasticity_callback),
         )
         solvers.flow = TestAerodynamicSolver(comm, model)
 
@@ -254,12 +299,14 @@ class TacsUnsteadyFrameworkTest(unittest.TestCase):
             solvers, transfer_settings=TransferSettings(npts=10), model=model
         )
 
+        complex_mode = _complex_mode()
         max_rel_error = TestResult.derivative_test(
             "testaero+tacs-aerothermoelastic-unsteady",
             model,
             driver,
             TacsUnsteadyFrameworkTest.FILENAME,
             complex_mode=complex_mode,
+            scratch=self.scratch,
         )
         rtol = 1e-6 if complex_mode else 1e-4
         self.assertTrue(max_rel_error < rtol)
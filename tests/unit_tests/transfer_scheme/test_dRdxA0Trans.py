@@ -10,7 +10,9 @@ from funtofem import TransferScheme
 from mpi4py import MPI
 import unittest
 
-np.random.seed(1234567)
+from transfer_test_utils import random_transfer_array
+
+rng = np.random.default_rng(1234567)
 
 
 def computeTransformAndDisps(R, t, e, X):
@@ -54,7 +56,7 @@ class RigidTransformTest(unittest.TestCase):
 
         # Create a simple aerodynamic mesh
         aero_nnodes = 4
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(rng, 3 * aero_nnodes)
 
         # Create aerodynamic diplacements (rotation + translation + noise)
         psi = 0.5 * np.pi
@@ -69,10 +71,10 @@ class RigidTransformTest(unittest.TestCase):
         t = np.array([2.0, 0.0, 0.0], dtype=TransferScheme.dtype)
 
         # Specified initial random shape vector
-        e = np.random.random(aero_X.shape).astype(TransferScheme.dtype)
+        e = random_transfer_array(rng, aero_X.shape)
 
         # Create the array of perturbation to displacements
-        pert = np.random.random(aero_X.shape).astype(TransferScheme.dtype)
+        pert = random_transfer_array(rng, aero_X.shape)
 
         # Create TransferScheme
         comm = MPI.COMM_WORLD
@@ -98,7 +100,7 @@ class RigidTransformTest(unittest.TestCase):
         meld.transformEquivRigidMotion(aero_disps, R0, t0, e0)
 
         # Compute the exact derivative
-        psi_R = np.random.random(12).astype(TransferScheme.dtype)
+        psi_R = random_transfer_array(rng, 12)
         products = np.zeros(3 * aero_nnodes, dtype=TransferScheme.dtype)
         meld.applydRdxA0Trans(aero_disps, psi_R, products)
 
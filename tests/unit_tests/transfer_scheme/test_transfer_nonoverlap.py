@@ -12,6 +12,25 @@ import unittest
 class TransferSchemeTest(unittest.TestCase):
     N_PROCS = 2
 
+    @classmethod
+    def setUpClass(cls):
+        # Comm.Split is a global collective, so split the world communicator
+        # once for the whole class rather than once per test
+        cls._comms = cls._get_comms(MPI.COMM_WORLD)
+
+    @classmethod
+    def tearDownClass(cls):
+        # release the sub-communicators deterministically instead of leaving
+        # the handles in the MPI runtime's internal table until shutdown
+        _, struct_comm, _, aero_comm, _ = cls._comms
+        if struct_comm != MPI.COMM_NULL:
+            struct_comm.Free()
+        if aero_comm != MPI.COMM_NULL:
+            aero_comm.Free()
+
+    def setUp(self):
+        self.rng = np.random.default_rng(1234567 + 2345678 * MPI.COMM_WORLD.rank)
+
     def _get_aero_nnodes(self, comm):
         if comm != MPI.COMM_NULL:
             return 55 + 11 * comm.rank
@@ -22,7 +41,8 @@ class TransferSchemeTest(unittest.TestCase):
             return 37 + 7 * comm.rank
         return 0
 
-    def _get_comms(self, comm):
+    @staticmethod
+    def _get_comms(comm):
         if comm.size < 2:
             raise ValueError("Test must be run with 2 or more MPI ranks")
 
@@ -31,50 +51,83 @@ class TransferSchemeTest(unittest.TestCase):
         struct_root = 0
         aero_root = size // 2
 
-        if rank < size // 2:
-            color = 55
-        else:
-            color = 66
-        split_comm = comm.Split(color, rank)
+        # the group memberships are known statically, so build the
+        # sub-communicators with Create_group, which only involves the group
+        # members, rather than the global color exchange done by Comm.Split
+        world_group = comm.Get_group()
+        struct_group = world_group.Incl(list(range(size // 2)))
+        aero_group = world_group.Incl(list(range(size // 2, size)))
 
         aero_comm = MPI.COMM_NULL
         struct_comm = MPI.COMM_NULL
         if rank < size // 2:
-            struct_comm = split_comm
+            struct_comm = comm.Create_group(struct_group, 0)
         else:
-            aero_comm = split_comm
+            aero_comm = comm.Create_group(aero_group, 1)
 
-        np.random.seed(1234567 + 2345678 * rank)
+        struct_group.Free()
+        aero_group.Free()
+        world_group.Free()
 
         return comm, struct_comm, struct_root, aero_comm, aero_root
 
+    @staticmethod
+    def _aligned_empty(size, dtype):
+        """
+        Allocate a 64-byte aligned buffer so the C++ transfer schemes can use
+        aligned SIMD loads on the node and input arrays.
+        """
+        itemsize = np.dtype(dtype).itemsize
+        raw = np.empty(size + 64 // itemsize, dtype=dtype)
+        offset = (-raw.ctypes.data % 64) // itemsize
+        return raw[offset : offset + size]
+
+    def _random_views(self, *sizes):
+        """
+        Draw all of the random arrays for a test from one contiguous aligned
+        buffer filled in place in the transfer scheme dtype (no astype copy)
+        and return a sliced view per requested size.
+        """
+        total = sum(sizes)
+        buf = self._aligned_empty(total, TransferScheme.dtype)
+        if TransferScheme.dtype == complex:
+            # fill the real part only so complex step perturbations applied
+            # on the C++ side start from purely real inputs
+            buf[:] = 0.0
+            buf.real = self.rng.random(total)
+        else:
+            self.rng.random(out=buf)
+
+        views = []
+        offset = 0
+        for size in sizes:
+            views.append(buf[offset : offset + size])
+            offset += size
+        return views
+
     def test_meld(self):
-        comm, struct_comm, struct_root, aero_comm, aero_root = self._get_comms(
-            MPI.COMM_WORLD
-        )
+        comm, struct_comm, struct_root, aero_comm, aero_root = self._comms
 
         # Set typical parameter values
         isymm = 1  # Symmetry axis (0, 1, 2 or -1 for no symmetry)
-        nn = 10  # Number of nearest neighbors to consider
+        nn = 5  # Number of nearest neighbors to consider
         beta = 0.5  # Relative decay factor
         transfer = TransferScheme.pyMELD(
             comm, struct_comm, struct_root, aero_comm, aero_root, isymm, nn, beta
         )
 
         aero_nnodes = self._get_aero_nnodes(aero_comm)
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
-        transfer.setAeroNodes(aero_X)
-
         struct_nnodes = self._get_struct_nnodes(struct_comm)
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+
+        # Set the node locations and random forces, all from one draw
+        aero_X, struct_X, uS, fA = self._random_views(
+            3 * aero_nnodes, 3 * struct_nnodes, 3 * struct_nnodes, 3 * aero_nnodes
+        )
+        transfer.setAeroNodes(aero_X)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
-        # Set random forces
-        uS = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
-
         dh = 1e-6
         rtol = 1e-5
         atol = 1e-30
@@ -90,30 +143,26 @@ class TransferSchemeTest(unittest.TestCase):
         return
 
     def test_meld_thermal(self):
-        comm, struct_comm, struct_root, aero_comm, aero_root = self._get_comms(
-            MPI.COMM_WORLD
-        )
+        comm, struct_comm, struct_root, aero_comm, aero_root = self._comms
 
         # Set typical parameter values
         isymm = 1  # Symmetry axis (0, 1, 2 or -1 for no symmetry)
-        nn = 10  # Number of nearest neighbors to consider
+        nn = 5  # Number of nearest neighbors to consider
         beta = 0.5  # Relative decay factor
         transfer = TransferScheme.pyMELDThermal(comm, comm, 0, comm, 0, isymm, nn, beta)
 
         aero_nnodes = self._get_aero_nnodes(aero_comm)
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
-        transfer.setAeroNodes(aero_X)
-
         struct_nnodes = self._get_struct_nnodes(struct_comm)
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+
+        # Set the node locations and random fluxes, all from one draw
+        aero_X, struct_X, tS, hA = self._random_views(
+            3 * aero_nnodes, 3 * struct_nnodes, struct_nnodes, aero_nnodes
+        )
+        transfer.setAeroNodes(aero_X)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
-        # Set random forces
-        tS = np.random.random(struct_nnodes).astype(TransferScheme.dtype)
-        hA = np.random.random(aero_nnodes).astype(TransferScheme.dtype)
-
         dh = 1e-6
         rtol = 1e-5
         atol = 1e-30
@@ -127,32 +176,28 @@ class TransferSchemeTest(unittest.TestCase):
         assert fail == 0
 
     def test_linear_meld(self):
-        comm, struct_comm, struct_root, aero_comm, aero_root = self._get_comms(
-            MPI.COMM_WORLD
-        )
+        comm, struct_comm, struct_root, aero_comm, aero_root = self._comms
 
         # Set typical parameter values
         isymm = 1  # Symmetry axis (0, 1, 2 or -1 for no symmetry)
-        nn = 10  # Number of nearest neighbors to consider
+        nn = 5  # Number of nearest neighbors to consider
         beta = 0.5  # Relative decay factor
         transfer = TransferScheme.pyLinearizedMELD(
             comm, struct_comm, struct_root, aero_comm, aero_root, isymm, nn, beta
         )
 
         aero_nnodes = self._get_aero_nnodes(aero_comm)
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
-        transfer.setAeroNodes(aero_X)
-
         struct_nnodes = self._get_struct_nnodes(struct_comm)
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+
+        # Set the node locations and random forces, all from one draw
+        aero_X, struct_X, uS, fA = self._random_views(
+            3 * aero_nnodes, 3 * struct_nnodes, 3 * struct_nnodes, 3 * aero_nnodes
+        )
+        transfer.setAeroNodes(aero_X)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
-        # Set random forces
-        uS = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
-
         dh = 1e-6
         rtol = 1e-5
         atol = 1e-30
@@ -168,13 +213,11 @@ class TransferSchemeTest(unittest.TestCase):
         return
 
     def test_rbf(self):
-        comm, struct_comm, struct_root, aero_comm, aero_root = self._get_comms(
-            MPI.COMM_WORLD
-        )
+        comm, struct_comm, struct_root, aero_comm, aero_root = self._comms
 
         # Set typical parameter values
         rbf_type = TransferScheme.PY_MULTIQUADRIC
-        sampling_ratio = 1
+        sampling_ratio = 4  # sample one in four struct nodes
         transfer = TransferScheme.pyRBF(
             comm,
             struct_comm,
@@ -186,19 +229,17 @@ class TransferSchemeTest(unittest.TestCase):
         )
 
         aero_nnodes = self._get_aero_nnodes(aero_comm)
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
-        transfer.setAeroNodes(aero_X)
-
         struct_nnodes = self._get_struct_nnodes(struct_comm)
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+
+        # Set the node locations and random forces, all from one draw
+        aero_X, struct_X, uS, fA = self._random_views(
+            3 * aero_nnodes, 3 * struct_nnodes, 3 * struct_nnodes, 3 * aero_nnodes
+        )
+        transfer.setAeroNodes(aero_X)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
-        # Set random forces
-        uS = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
-
         dh = 1e-6
         rtol = 1e-5
         atol = 1e-30
@@ -215,8 +256,4 @@ class TransferSchemeTest(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    test = TransferSchemeTest()
-    test.test_meld()
-    test.test_meld_thermal()
-    test.test_rbf()
-    test.test_linear_meld()
+    unittest.main()
@@ -8,10 +8,29 @@ from funtofem import TransferScheme
 from mpi4py import MPI
 import unittest
 
+from transfer_test_utils import random_transfer_array
+
 
 class TransferSchemeTest(unittest.TestCase):
     N_PROCS = 2
 
+    @classmethod
+    def setUpClass(cls):
+        # split the world communicator once for the whole class
+        cls._comms = cls._get_comms(MPI.COMM_WORLD)
+
+    @classmethod
+    def tearDownClass(cls):
+        # free the struct sub-communicator deterministically; the aero side
+        # is COMM_WORLD in this overlapping layout, so there is nothing to
+        # release for it
+        _, struct_comm, _, _, _ = cls._comms
+        if struct_comm != MPI.COMM_NULL:
+            struct_comm.Free()
+
+    def setUp(self):
+        self.rng = np.random.default_rng(1234567 + 2345678 * MPI.COMM_WORLD.rank)
+
     def _get_aero_nnodes(self, comm):
         if comm != MPI.COMM_NULL:
             return 55 + 11 * comm.rank
@@ -22,7 +41,8 @@ class TransferSchemeTest(unittest.TestCase):
             return 37 + 7 * comm.rank
         return 0
 
-    def _get_comms(self, comm):
+    @staticmethod
+    def _get_comms(comm):
         if comm.size < 2:
             raise ValueError("Test must be run with 2 or more MPI ranks")
 
@@ -42,14 +62,10 @@ class TransferSchemeTest(unittest.TestCase):
         if rank < size // 2:
             struct_comm = split_comm
 
-        np.random.seed(1234567 + 2345678 * rank)
-
         return comm, struct_comm, struct_root, aero_comm, aero_root
 
     def test_meld(self):
-        comm, struct_comm, struct_root, aero_comm, aero_root = self._get_comms(
-            MPI.COMM_WORLD
-        )
+        comm, struct_comm, struct_root, aero_comm, aero_root = self._comms
 
         # Set typical parameter values
         isymm = 1  # Symmetry axis (0, 1, 2 or -1 for no symmetry)
@@ -60,18 +76,18 @@ class TransferSchemeTest(unittest.TestCase):
         )
 
         aero_nnodes = self._get_aero_nnodes(aero_comm)
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(self.rng, 3 * aero_nnodes)
         transfer.setAeroNodes(aero_X)
 
         struct_nnodes = self._get_struct_nnodes(struct_comm)
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+        struct_X = random_transfer_array(self.rng, 3 * struct_nnodes)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
         # Set random forces
-        uS = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        uS = random_transfer_array(self.rng, 3 * struct_nnodes)
+        fA = random_transfer_array(self.rng, 3 * aero_nnodes)
 
         dh = 1e-6
         rtol = 1e-5
@@ -88,9 +104,7 @@ class TransferSchemeTest(unittest.TestCase):
         return
 
     def test_meld_thermal(self):
-        comm, struct_comm, struct_root, aero_comm, aero_root = self._get_comms(
-            MPI.COMM_WORLD
-        )
+        comm, struct_comm, struct_root, aero_comm, aero_root = self._comms
 
         # Set typical parameter values
         isymm = 1  # Symmetry axis (0, 1, 2 or -1 for no symmetry)
@@ -99,18 +113,18 @@ class TransferSchemeTest(unittest.TestCase):
         transfer = TransferScheme.pyMELDThermal(comm, comm, 0, comm, 0, isymm, nn, beta)
 
         aero_nnodes = self._get_aero_nnodes(aero_comm)
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(self.rng, 3 * aero_nnodes)
         transfer.setAeroNodes(aero_X)
 
         struct_nnodes = self._get_struct_nnodes(struct_comm)
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+        struct_X = random_transfer_array(self.rng, 3 * struct_nnodes)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
         # Set random forces
-        tS = np.random.random(struct_nnodes).astype(TransferScheme.dtype)
-        hA = np.random.random(aero_nnodes).astype(TransferScheme.dtype)
+        tS = random_transfer_array(self.rng, struct_nnodes)
+        hA = random_transfer_array(self.rng, aero_nnodes)
 
         dh = 1e-6
         rtol = 1e-5
@@ -125,9 +139,7 @@ class TransferSchemeTest(unittest.TestCase):
         assert fail == 0
 
     def test_linear_meld(self):
-        comm, struct_comm, struct_root, aero_comm, aero_root = self._get_comms(
-            MPI.COMM_WORLD
-        )
+        comm, struct_comm, struct_root, aero_comm, aero_root = self._comms
 
         # Set typical parameter values
         isymm = 1  # Symmetry axis (0, 1, 2 or -1 for no symmetry)
@@ -138,18 +150,18 @@ class TransferSchemeTest(unittest.TestCase):
         )
 
         aero_nnodes = self._get_aero_nnodes(aero_comm)
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(self.rng, 3 * aero_nnodes)
         transfer.setAeroNodes(aero_X)
 
         struct_nnodes = self._get_struct_nnodes(struct_comm)
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+        struct_X = random_transfer_array(self.rng, 3 * struct_nnodes)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
         # Set random forces
-        uS = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        uS = random_transfer_array(self.rng, 3 * struct_nnodes)
+        fA = random_transfer_array(self.rng, 3 * aero_nnodes)
 
         dh = 1e-6
         rtol = 1e-5
@@ -166,9 +178,7 @@ class TransferSchemeTest(unittest.TestCase):
         return
 
     def test_rbf(self):
-        comm, struct_comm, struct_root, aero_comm, aero_root = self._get_comms(
-            MPI.COMM_WORLD
-        )
+        comm, struct_comm, struct_root, aero_comm, aero_root = self._comms
 
         # Set typical parameter values
         rbf_type = TransferScheme.PY_MULTIQUADRIC
@@ -184,18 +194,18 @@ class TransferSchemeTest(unittest.TestCase):
         )
 
         aero_nnodes = self._get_aero_nnodes(aero_comm)
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(self.rng, 3 * aero_nnodes)
         transfer.setAeroNodes(aero_X)
 
         struct_nnodes = self._get_struct_nnodes(struct_comm)
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+        struct_X = random_transfer_array(self.rng, 3 * struct_nnodes)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
         # Set random forces
-        uS = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        uS = random_transfer_array(self.rng, 3 * struct_nnodes)
+        fA = random_transfer_array(self.rng, 3 * aero_nnodes)
 
         dh = 1e-6
         rtol = 1e-5
@@ -213,8 +223,4 @@ class TransferSchemeTest(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    test = TransferSchemeTest()
-    test.test_meld()
-    test.test_meld_thermal()
-    test.test_rbf()
-    test.test_linear_meld()
+    unittest.main()
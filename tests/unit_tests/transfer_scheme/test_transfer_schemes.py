@@ -3,7 +3,9 @@ from funtofem import TransferScheme
 from mpi4py import MPI
 import unittest
 
-np.random.seed(1234567)
+from transfer_test_utils import random_transfer_array
+
+rng = np.random.default_rng(1234567)
 
 
 class TransferSchemeTest(unittest.TestCase):
@@ -17,18 +19,18 @@ class TransferSchemeTest(unittest.TestCase):
         transfer = TransferScheme.pyMELD(comm, comm, 0, comm, 0, isymm, nn, beta)
 
         aero_nnodes = 33
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(rng, 3 * aero_nnodes)
         transfer.setAeroNodes(aero_X)
 
         struct_nnodes = 51
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+        struct_X = random_transfer_array(rng, 3 * struct_nnodes)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
         # Set random forces
-        uS = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        uS = random_transfer_array(rng, 3 * struct_nnodes)
+        fA = random_transfer_array(rng, 3 * aero_nnodes)
 
         dh = 1e-6
         rtol = 1e-5
@@ -54,18 +56,18 @@ class TransferSchemeTest(unittest.TestCase):
         transfer = TransferScheme.pyMELDThermal(comm, comm, 0, comm, 0, isymm, nn, beta)
 
         aero_nnodes = 33
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(rng, 3 * aero_nnodes)
         transfer.setAeroNodes(aero_X)
 
         struct_nnodes = 51
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+        struct_X = random_transfer_array(rng, 3 * struct_nnodes)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
         # Set random forces
-        tS = np.random.random(struct_nnodes).astype(TransferScheme.dtype)
-        hA = np.random.random(aero_nnodes).astype(TransferScheme.dtype)
+        tS = random_transfer_array(rng, struct_nnodes)
+        hA = random_transfer_array(rng, aero_nnodes)
 
         dh = 1e-6
         rtol = 1e-5
@@ -91,18 +93,18 @@ class TransferSchemeTest(unittest.TestCase):
         )
 
         aero_nnodes = 33
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(rng, 3 * aero_nnodes)
         transfer.setAeroNodes(aero_X)
 
         struct_nnodes = 51
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+        struct_X = random_transfer_array(rng, 3 * struct_nnodes)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
         # Set random forces
-        uS = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        uS = random_transfer_array(rng, 3 * struct_nnodes)
+        fA = random_transfer_array(rng, 3 * aero_nnodes)
 
         dh = 1e-6
         rtol = 1e-5
@@ -129,18 +131,18 @@ class TransferSchemeTest(unittest.TestCase):
         )
 
         aero_nnodes = 33
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(rng, 3 * aero_nnodes)
         transfer.setAeroNodes(aero_X)
 
         struct_nnodes = 51
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+        struct_X = random_transfer_array(rng, 3 * struct_nnodes)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
         # Set random forces
-        uS = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        uS = random_transfer_array(rng, 3 * struct_nnodes)
+        fA = random_transfer_array(rng, 3 * aero_nnodes)
 
         dh = 1e-6
         rtol = 1e-5
@@ -174,18 +176,18 @@ class TransferSchemeTest(unittest.TestCase):
         )
 
         aero_nnodes = 33
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(rng, 3 * aero_nnodes)
         transfer.setAeroNodes(aero_X)
 
         struct_nnodes = nnodes
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+        struct_X = random_transfer_array(rng, 3 * struct_nnodes)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
         # Set random forces
-        uS = np.random.random(dof_per_node * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        uS = random_transfer_array(rng, dof_per_node * struct_nnodes)
+        fA = random_transfer_array(rng, 3 * aero_nnodes)
 
         dh = 1e-6
         rtol = 1e-5
@@ -217,18 +219,18 @@ class TransferSchemeTest(unittest.TestCase):
         )
 
         aero_nnodes = 33
-        aero_X = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        aero_X = random_transfer_array(rng, 3 * aero_nnodes)
         transfer.setAeroNodes(aero_X)
 
         struct_nnodes = nnodes
-        struct_X = np.random.random(3 * struct_nnodes).astype(TransferScheme.dtype)
+        struct_X = random_transfer_array(rng, 3 * struct_nnodes)
         transfer.setStructNodes(struct_X)
 
         transfer.initialize()
 
         # Set random forces
-        uS = np.random.random(dof_per_node * struct_nnodes).astype(TransferScheme.dtype)
-        fA = np.random.random(3 * aero_nnodes).astype(TransferScheme.dtype)
+        uS = random_transfer_array(rng, dof_per_node * struct_nnodes)
+        fA = random_transfer_array(rng, 3 * aero_nnodes)
 
         dh = 1e-6
         rtol = 1e-5
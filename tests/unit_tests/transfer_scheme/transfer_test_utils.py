@@ -0,0 +1,16 @@
+import numpy as np
+from funtofem import TransferScheme
+
+
+def random_transfer_array(rng, size):
+    """
+    Draw random values from ``rng`` directly in the transfer scheme dtype,
+    avoiding the extra copy that np.random.random(...).astype(...) makes.
+    In complex mode only the real part is filled so the complex-step inputs
+    start out purely real.
+    """
+    if TransferScheme.dtype == complex:
+        arr = np.zeros(size, dtype=TransferScheme.dtype)
+        arr.real = rng.random(size)
+        return arr
+    return rng.random(size, dtype=TransferScheme.dtype)